@@ -12,28 +12,37 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-import glob
+import concurrent.futures
 import logging
 import os
 import shutil
+import zipfile
+from concurrent.futures import Future
 from pprint import pformat
-from typing import List, Optional, Tuple
+from typing import FrozenSet, List, Optional, Set, Tuple
 
 from aws_orbit.models.context import Context
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
 
-def _is_valid_image_file(file_path: str) -> bool:
-    for word in ("/node_modules/", "/build/", "/.mypy_cache/", ".egg-info", "__pycache__"):
-        if word in file_path:
-            return False
-    return True
+_IGNORED_NAMES: FrozenSet[str] = frozenset(("node_modules", "build", "__pycache__"))
+_IGNORED_SUFFIXES: Tuple[str, ...] = (".egg-info", ".pyc")
 
 
-def _list_files(path: str) -> List[str]:
-    path = os.path.join(path, "**")
-    return [f for f in glob.iglob(path, recursive=True) if os.path.isfile(f) and _is_valid_image_file(file_path=f)]
+def _ignore_files(dir: str, names: List[str]) -> Set[str]:
+    # Hidden entries (.git, .venv, .env, .orbit.out, ...) are never bundled
+    return {n for n in names if n.startswith(".") or n in _IGNORED_NAMES or n.endswith(_IGNORED_SUFFIXES)}
+
+
+def _has_files(path: str) -> bool:
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                return True
+            if entry.is_dir(follow_symlinks=False) and _has_files(path=entry.path):
+                return True
+    return False
 
 
 def _generate_dir(bundle_dir: str, dir: str, name: str) -> str:
@@ -41,21 +50,12 @@ def _generate_dir(bundle_dir: str, dir: str, name: str) -> str:
     final_dir = os.path.join(bundle_dir, name)
     _logger.debug("absolute_dir: %s", absolute_dir)
     _logger.debug("final_dir: %s", final_dir)
-    os.makedirs(final_dir, exist_ok=True)
-    shutil.rmtree(final_dir)
+    shutil.rmtree(final_dir, ignore_errors=True)
 
     _logger.debug("Copying files to %s", final_dir)
-    files: List[str] = _list_files(path=absolute_dir)
-    if len(files) == 0:
+    shutil.copytree(src=absolute_dir, dst=final_dir, ignore=_ignore_files, copy_function=shutil.copy)
+    if not _has_files(path=final_dir):
         raise ValueError(f"{name} ({absolute_dir}) is empty!")
-    for file in files:
-        _logger.debug(f"***file={file}")
-        relpath = os.path.relpath(file, absolute_dir)
-        new_file = os.path.join(final_dir, relpath)
-        _logger.debug("Copying file to %s", new_file)
-        os.makedirs(os.path.dirname(new_file), exist_ok=True)
-        _logger.debug("Copying file to %s", new_file)
-        shutil.copy(src=file, dst=new_file)
 
     return final_dir
 
@@ -74,15 +74,22 @@ def generate_bundle(
     os.makedirs(bundle_dir, exist_ok=True)
     _logger.debug(f"generate_bundle dirs={dirs}")
     # Extra Directories
-    if dirs is not None:
-        for dir, name in dirs:
-            _logger.debug(f"***dir={dir}:name={name}")
-            _generate_dir(bundle_dir=bundle_dir, dir=dir, name=name)
+    if dirs:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(dirs))) as executor:
+            futures: List[Future[str]] = [executor.submit(_generate_dir, bundle_dir, dir, name) for dir, name in dirs]
+            for f in futures:
+                _logger.debug("Bundled %s", f.result())
 
     _logger.debug("bundle_dir: %s", bundle_dir)
 
-    files = glob.glob(bundle_dir + "/**", recursive=True)
-    _logger.debug("files:\n%s", pformat(files))
-
-    shutil.make_archive(base_name=bundle_dir, format="zip", root_dir=remote_dir, base_dir="bundle")
-    return bundle_dir + ".zip"
+    bundle_path = bundle_dir + ".zip"
+    with zipfile.ZipFile(bundle_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for root, _, files in os.walk(bundle_dir):
+            # Directory entries keep the layout shutil.make_archive produced, including empty directories
+            zf.write(root, arcname=os.path.relpath(root, remote_dir))
+            for file in files:
+                file_path = os.path.join(root, file)
+                zf.write(file_path, arcname=os.path.relpath(file_path, remote_dir))
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("files:\n%s", pformat(zf.namelist()))
+    return bundle_path
@@ -27,15 +27,14 @@ _logger: logging.Logger = logging.getLogger(__name__)
 
 
 def _fetch_repo_uri(names: List[str], context: "Context") -> Dict[str, str]:
-    names = [f"orbit-{context.name}-{x}" for x in names]
-    ret: Dict[str, str] = {x: "" for x in names}
+    prefixed: List[str] = [f"orbit-{context.name}-{x}" for x in names]
+    uris: Dict[str, str] = {}
     client = boto3_client("ecr")
-    paginator = client.get_paginator("describe_repositories")
-    for page in paginator.paginate(repositoryNames=names):
-        for repo in page["repositories"]:
-            ret[repo["repositoryName"]] = repo["repositoryUri"]
-    ret = {k.replace(f"orbit-{context.name}-", ""): v for k, v in ret.items()}
-    return ret
+    # Lookups by name take up to 100 names per call and are never paginated
+    for i in range(0, len(prefixed), 100):
+        for repo in client.describe_repositories(repositoryNames=prefixed[i : i + 100])["repositories"]:  # noqa: E203
+            uris[repo["repositoryName"]] = repo["repositoryUri"]
+    return {name: uris.get(repo_name, "") for name, repo_name in zip(names, prefixed)}
 
 
 def list_images(env: str, region: Optional[str]) -> None:
@@ -537,8 +537,9 @@ class ContextSerDe(Generic[T, V]):
             _logger.debug("Raw SSM: %s", main)
             teams_parameters = ssm.list_parameters(prefix=f"/orbit/{env_name}/teams/")
             _logger.debug("teams_parameters: %s", teams_parameters)
-            teams = [ssm.get_parameter_if_exists(name=p) for p in teams_parameters if p.endswith("/context")]
-            main["Teams"] = [t for t in teams if t]
+            main["Teams"] = ssm.get_parameters(
+                names=[p for p in teams_parameters if p.endswith("/context")], ignore_missing=True
+            )
             return cast(V, Context.Schema().load(data=main, many=False, partial=False, unknown="EXCLUDE"))
         elif type is FoundationContext:
             context_parameter_name = f"/orbit-f/{env_name}/context"
@@ -14,11 +14,16 @@
 
 # flake8: noqa: F811
 
+import concurrent.futures
+import copy
 import json
 import logging
 import os
 import re
-from typing import Any, ClassVar, Dict, Generic, List, Optional, Set, Type, TypeVar, Union, cast
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar, Union, cast
 
 import jsonpath_ng as jsonpath_ng
 import yaml
@@ -33,9 +38,25 @@ from aws_orbit.models.common import BaseSchema
 from aws_orbit.services import ssm
 from aws_orbit.utils import boto3_client
 
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper  # type: ignore
+    from yaml import SafeLoader as _Loader  # type: ignore
+
 _logger: logging.Logger = logging.getLogger(__name__)
 
 SSM_CONTEXT: Dict[str, str] = {}
+_SSM_CONTEXT_LOCK = threading.Lock()
+
+# pattern for global vars: look for ${word}
+_INJECTION_PATTERN = re.compile(".*?\${([^}]+::[^}]*)}.*?")  # noqa: W605
+
+
+@lru_cache(maxsize=256)
+def _parse_jsonpath(expr: str) -> Any:
+    return jsonpath_ng.parse(expr)
 
 
 @dataclass(base_schema=BaseSchema, frozen=True)
@@ -224,10 +245,20 @@ class Manifest:
     install_image_replicator: Optional[bool] = False
 
     def get_team_by_name(self, name: str) -> Optional[TeamManifest]:
-        for t in self.teams:
-            if t.name == name:
-                return t
-        return None
+        teams_index: Optional[Dict[str, TeamManifest]] = self.__dict__.get("_teams_index")
+        if teams_index is None:
+            # First match wins, as in a linear scan over teams
+            teams_index = {t.name: t for t in reversed(self.teams)}
+            object.__setattr__(self, "_teams_index", teams_index)
+        return teams_index.get(name)
+
+
+_MANIFEST_SCHEMA: Schema = Manifest.Schema()
+_FOUNDATION_MANIFEST_SCHEMA: Schema = FoundationManifest.Schema()
+
+
+class OrbitLoader(_Loader):
+    """Manifest loader, kept apart from yaml.SafeLoader so the injectors below don't leak into it."""
 
 
 def _add_ssm_param_injector(tag: str = "!SSM") -> Set[str]:
@@ -240,9 +271,8 @@ def _add_ssm_param_injector(tag: str = "!SSM") -> Set[str]:
         host: !SSM ${/orbit-f/dev-env/resources::/UserAccessPolicy}
         port: !SSM ${/orbit-f/dev-env/resources::/PublicSubnet/*}
     """
-    # pattern for global vars: look for ${word}
-    pattern = re.compile(".*?\${([^}]+::[^}]*)}.*?")  # noqa: W605
-    loader = yaml.SafeLoader
+    pattern = _INJECTION_PATTERN
+    loader = OrbitLoader
 
     # the tag will be used to mark where to start searching for the pattern
     # e.g. somekey: !SSM somestring${MYENVVAR}blah blah blah
@@ -268,17 +298,18 @@ def _add_ssm_param_injector(tag: str = "!SSM") -> Set[str]:
                 if "${" in ssm_param_name:
                     ssm_param_name = ssm_param_name.replace("$", "").format(os.environ)
                 _logger.debug(f"found injected parameter {(ssm_param_name, jsonpath)}")
-                if ssm_param_name not in SSM_CONTEXT:
-                    ssm = boto3_client("ssm")
-                    try:
-                        SSM_CONTEXT[ssm_param_name] = json.loads(
-                            ssm.get_parameter(Name=ssm_param_name)["Parameter"]["Value"]
-                        )
-                        ssm_parameters.add(ssm_param_name)
-                    except Exception as e:
-                        _logger.error(f"Error resolving injected parameter {g}: {e}")
-
-                json_expr = jsonpath_ng.parse(jsonpath)
+                with _SSM_CONTEXT_LOCK:
+                    if ssm_param_name not in SSM_CONTEXT:
+                        ssm = boto3_client("ssm")
+                        try:
+                            SSM_CONTEXT[ssm_param_name] = json.loads(
+                                ssm.get_parameter(Name=ssm_param_name)["Parameter"]["Value"]
+                            )
+                            ssm_parameters.add(ssm_param_name)
+                        except Exception as e:
+                            _logger.error(f"Error resolving injected parameter {g}: {e}")
+
+                json_expr = _parse_jsonpath(jsonpath)
                 json_data = SSM_CONTEXT[ssm_param_name]
                 json_match = json_expr.find(json_data)
 
@@ -310,9 +341,8 @@ def _add_env_var_injector(tag: str = "!ENV") -> None:
         log_path: !ENV '/var/${LOG_PATH}'
         something_else: !ENV '${AWESOME_ENV_VAR}/var/${A_SECOND_AWESOME_VAR}'
     """
-    # pattern for global vars: look for ${word}
-    pattern = re.compile(".*?\${([^}]+::[^}]*)}.*?")  # noqa: W605
-    loader = yaml.SafeLoader
+    pattern = _INJECTION_PATTERN
+    loader = OrbitLoader
 
     # the tag will be used to mark where to start searching for the pattern
     # e.g. somekey: !ENV somestring${MYENVVAR}blah blah blah
@@ -343,8 +373,21 @@ def _add_env_var_injector(tag: str = "!ENV") -> None:
     loader.add_constructor(tag, constructor_env_variables)  # type: ignore
 
 
+_add_ssm_param_injector()
+_add_env_var_injector()
+
 T = TypeVar("T")
 
+# Parsed manifests keyed by (absolute path, manifest type), validated against the file's (mtime, size).
+# Opt-in with AWS_ORBIT_MANIFEST_CACHE=1: !ENV values and !include'd files are not part of the key,
+# so only enable it where neither changes between loads in the same process.
+_MANIFEST_FILE_CACHE: "OrderedDict[Tuple[str, Any], Tuple[int, int, Any]]" = OrderedDict()
+_MANIFEST_FILE_CACHE_SIZE = 32
+
+
+def _manifest_file_cache_enabled() -> bool:
+    return os.environ.get("AWS_ORBIT_MANIFEST_CACHE", "0") == "1"
+
 
 class ManifestSerDe(Generic[T]):
     @staticmethod
@@ -352,22 +395,35 @@ class ManifestSerDe(Generic[T]):
         _logger.debug("Loading manifest file (%s)", filename)
         filepath = os.path.abspath(filename)
         _logger.debug("filepath: %s", filepath)
+        use_cache = _manifest_file_cache_enabled()
+        stat = os.stat(filepath)
+        cache_key = (filepath, type)
+        cached = _MANIFEST_FILE_CACHE.get(cache_key) if use_cache else None
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _logger.debug("Manifest file unchanged since last load, using cached manifest")
+            _MANIFEST_FILE_CACHE.move_to_end(cache_key)
+            manifest: T = copy.deepcopy(cached[2])
+            ManifestSerDe.dump_manifest_to_ssm(manifest=manifest)
+            return manifest
         filedir: str = os.path.dirname(filepath)
         utils.print_dir(dir=filedir)
-        YamlIncludeConstructor.add_to_loader_class(loader_class=yaml.SafeLoader, base_dir=filedir)
-        _add_ssm_param_injector()
-        _add_env_var_injector()
+        YamlIncludeConstructor.add_to_loader_class(loader_class=OrbitLoader, base_dir=filedir)
         with open(filepath, "r") as f:
-            raw: Dict[str, Any] = cast(Dict[str, Any], yaml.safe_load(f))
+            raw: Dict[str, Any] = cast(Dict[str, Any], yaml.load(f, Loader=OrbitLoader))
         _logger.debug("raw: %s", raw)
         if type is Manifest:
             raw["SsmParameterName"] = f"/orbit/{raw['Name']}/manifest"
-            manifest: T = cast(T, Manifest.Schema().load(data=raw, many=False, partial=False, unknown=EXCLUDE))
+            manifest = cast(T, _MANIFEST_SCHEMA.load(data=raw, many=False, partial=False, unknown=EXCLUDE))
         elif type is FoundationManifest:
             raw["SsmParameterName"] = f"/orbit-f/{raw['Name']}/manifest"
-            manifest = cast(T, FoundationManifest.Schema().load(data=raw, many=False, partial=False, unknown=EXCLUDE))
+            manifest = cast(T, _FOUNDATION_MANIFEST_SCHEMA.load(data=raw, many=False, partial=False, unknown=EXCLUDE))
         else:
             raise ValueError("Unknown 'manifest' Type")
+        if use_cache:
+            _MANIFEST_FILE_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(manifest))
+            _MANIFEST_FILE_CACHE.move_to_end(cache_key)
+            if len(_MANIFEST_FILE_CACHE) > _MANIFEST_FILE_CACHE_SIZE:
+                _MANIFEST_FILE_CACHE.popitem(last=False)
         ManifestSerDe.dump_manifest_to_ssm(manifest=manifest)
         return manifest
 
@@ -375,14 +431,14 @@ class ManifestSerDe(Generic[T]):
     def dump_manifest_to_file(manifest: T, filepath: str) -> None:
         _logger.debug("Dumping manifest file (%s)", filepath)
         if isinstance(manifest, Manifest):
-            content: Dict[str, Any] = cast(Dict[str, Any], Manifest.Schema().dump(manifest))
+            content: Dict[str, Any] = cast(Dict[str, Any], _MANIFEST_SCHEMA.dump(manifest))
         elif isinstance(manifest, FoundationManifest):
-            content = cast(Dict[str, Any], FoundationManifest.Schema().dump(manifest))
+            content = cast(Dict[str, Any], _FOUNDATION_MANIFEST_SCHEMA.dump(manifest))
         else:
             raise ValueError("Unknown 'manifest' Type")
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         with open(filepath, "w") as f:
-            yaml.dump(content, f, sort_keys=False)
+            yaml.dump(content, f, Dumper=_Dumper, sort_keys=False)
 
     @staticmethod
     def dump_manifest_to_ssm(manifest: T) -> None:
@@ -390,16 +446,19 @@ class ManifestSerDe(Generic[T]):
 
         if isinstance(manifest, Manifest):
             _logger.debug("Teams: %s", [t.name for t in manifest.teams])
-            content: Dict[str, Any] = cast(Dict[str, Any], Manifest.Schema().dump(manifest))
+            content: Dict[str, Any] = cast(Dict[str, Any], _MANIFEST_SCHEMA.dump(manifest))
             ssm.cleanup_manifest(env_name=manifest.name)
             if "Teams" in content:
-                for team in content["Teams"]:
-                    team_parameter_name: str = f"/orbit/{manifest.name}/teams/{team['Name']}/manifest"
-                    ssm.put_parameter(name=team_parameter_name, obj=team)
+                teams: List[Dict[str, Any]] = content["Teams"]
+                if teams:
+                    names = [f"/orbit/{manifest.name}/teams/{team['Name']}/manifest" for team in teams]
+                    # Matches max_pool_connections of the shared boto3 client (utils.boto3_client)
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=min(10, len(teams))) as executor:
+                        list(executor.map(ssm.put_parameter, names, teams))
                 del content["Teams"]
             manifest_parameter_name = manifest.ssm_parameter_name
         elif isinstance(manifest, FoundationManifest):
-            content = cast(Dict[str, Any], FoundationManifest.Schema().dump(manifest))
+            content = cast(Dict[str, Any], _FOUNDATION_MANIFEST_SCHEMA.dump(manifest))
             ssm.cleanup_manifest(env_name=manifest.name, top_level="orbit-f")
             manifest_parameter_name = manifest.ssm_parameter_name
         else:
@@ -416,15 +475,15 @@ class ManifestSerDe(Generic[T]):
                 return None
             teams_parameters = ssm.list_parameters(prefix=f"/orbit/{env_name}/teams/")
             _logger.debug("teams_parameters (/orbit/%s/teams/): %s", env_name, teams_parameters)
-            teams = [ssm.get_parameter(name=p) for p in teams_parameters if p.endswith("/manifest")]
+            teams = ssm.get_parameters(names=[p for p in teams_parameters if p.endswith("/manifest")])
             main["Teams"] = teams
-            return cast(T, Manifest.Schema().load(data=main, many=False, partial=False, unknown=EXCLUDE))
+            return cast(T, _MANIFEST_SCHEMA.load(data=main, many=False, partial=False, unknown=EXCLUDE))
         elif type is FoundationManifest:
             context_parameter_name = f"/orbit-f/{env_name}/manifest"
             main = ssm.get_parameter_if_exists(name=context_parameter_name)
             if main is None:
                 return None
-            return cast(T, FoundationManifest.Schema().load(data=main, many=False, partial=False, unknown=EXCLUDE))
+            return cast(T, _FOUNDATION_MANIFEST_SCHEMA.load(data=main, many=False, partial=False, unknown=EXCLUDE))
         else:
             raise ValueError("Unknown 'manifest' Type")
 
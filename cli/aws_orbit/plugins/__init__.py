@@ -14,7 +14,7 @@
 
 import importlib
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Union, cast
 
 from aws_orbit import utils
 from aws_orbit.services import s3
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
     from aws_orbit.messages import MessagesContext
     from aws_orbit.models.changeset import PluginChangeset, TeamsChangeset
     from aws_orbit.models.context import Context, TeamContext
+    from aws_orbit.models.manifest import PluginManifest
 
 HOOK_FUNC_TYPE = Callable[[str, "Context", "TeamContext", Dict[str, Any]], Union[None, List[str], str]]
 HOOK_TYPE = Optional[HOOK_FUNC_TYPE]
@@ -274,6 +275,22 @@ class PluginRegistries:
             return cast(HOOK_TYPE, None)
         return cast(HOOK_TYPE, self._registries[team_name][plugin_name].__getattribute__(hook_name))
 
+    def get_hooks(
+        self, context: "Context", team_context: "TeamContext", hook_name: str
+    ) -> List[Tuple["PluginManifest", HOOK_FUNC_TYPE]]:
+        self._context = context
+        # Teams without plugins may never have been registered, only look the team up when it has some
+        if not team_context.plugins:
+            return []
+        registries = self._registries[team_context.name]
+        hooks: List[Tuple["PluginManifest", HOOK_FUNC_TYPE]] = []
+        for plugin in team_context.plugins:
+            if plugin.plugin_id in registries:
+                hook: HOOK_TYPE = registries[plugin.plugin_id].__getattribute__(hook_name)
+                if hook is not None:
+                    hooks.append((plugin, hook))
+        return hooks
+
     def destroy_plugin(self, context: "Context", team_context: "TeamContext", plugin_id: str) -> None:
         self._context = context
         if plugin_id not in self._registries[team_context.name]:
@@ -100,7 +100,6 @@ def run(
         raise ValueError(f"context.toolkit.s3_bucket: {context.toolkit.s3_bucket}")
     bucket: str = context.toolkit.s3_bucket
     key: str = f"cli/remote/{command_name}/bundle.zip"
-    s3.delete_objects(bucket=bucket, keys=[key])
     s3.upload_file(src=bundle_path, bucket=bucket, key=key)
     _execute_codebuild(
         context=context,
@@ -11,11 +11,12 @@ logger.setLevel(logging.INFO)
 
 orbit_env = os.environ.get("ORBIT_ENV")
 
+cognito_client = boto3.client("cognito-idp")
+lambda_client = boto3.client("lambda")
+ssm_client = boto3.client("ssm")
 
-def handler(event: Dict[str, Any], context: Optional[Dict[str, Any]]) -> Any:
 
-    cognito_client = boto3.client("cognito-idp")
-    lambda_client = boto3.client("lambda")
+def handler(event: Dict[str, Any], context: Optional[Dict[str, Any]]) -> Any:
 
     user_name = cast(str, event.get("userName"))
     user_email = cast(str, event["request"]["userAttributes"].get("email", "invalid_email"))
@@ -24,13 +25,17 @@ def handler(event: Dict[str, Any], context: Optional[Dict[str, Any]]) -> Any:
 
     user_pool_id = cast(str, event.get("userPoolId"))
 
-    user_groups_info = cognito_client.admin_list_groups_for_user(Username=user_name, UserPoolId=user_pool_id)
-    # user_groups = [group.get("GroupName").split(f"{orbit_env}-")[1] for group in user_groups_info.get("Groups")]
+    paginator = cognito_client.get_paginator("admin_list_groups_for_user")
+    groups = [
+        group
+        for page in paginator.paginate(Username=user_name, UserPoolId=user_pool_id)
+        for group in page.get("Groups")
+    ]
 
     team_info = get_auth_group_from_ssm()
 
     user_groups = []
-    for group in user_groups_info.get("Groups"):
+    for group in groups:
         group_name = group.get("GroupName")
         if (f"{orbit_env}-") in group_name:
             group_name = group_name.split(f"{orbit_env}-")[1]
@@ -67,8 +72,6 @@ def validate_email(email: str) -> None:
 
 
 def get_auth_group_from_ssm() -> Dict[str, List[str]]:
-    ssm_client = boto3.client("ssm")
-
     team_info = {}
 
     team_manifest_pattern = re.compile(rf"/orbit/{orbit_env}/teams/.*/manifest")
@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import shlex
 import subprocess
 import time
 from typing import Any, Dict, List, Optional, cast
@@ -34,7 +35,7 @@ def handler(event: Dict[str, Any], context: Optional[Dict[str, Any]]) -> Any:
 
 def run_command(cmd: str) -> None:
     """ Module to run shell commands. """
-    cmds = cmd.split(" ")
+    cmds = shlex.split(cmd)
     try:
         output = subprocess.run(cmds, stderr=subprocess.STDOUT, shell=False, timeout=120, universal_newlines=True)
         print(output)
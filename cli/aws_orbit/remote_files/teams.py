@@ -12,9 +12,11 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import concurrent.futures
 import logging
 import os
 import shutil
+from concurrent.futures import Future
 from typing import Iterator, List, Optional, cast
 
 import boto3
@@ -60,17 +62,18 @@ def _create_dockerfile(context: "Context", team_context: "TeamContext", image_na
     cmds += ["USER root"]
     cmds += ["ADD pip.conf /etc/pip.conf"]
 
+    hooks = {
+        plugin.plugin_id: hook
+        for plugin, hook in plugins.PLUGINS_REGISTRIES.get_hooks(
+            context=context, team_context=team_context, hook_name="dockerfile_injection_hook"
+        )
+    }
     for plugin in team_context.plugins:
         # Adding plugin modules to image via pip
         plugin_module_name = (plugin.module).replace("_", "-")
         cmds += [f"RUN pip install --upgrade aws-orbit-{plugin_module_name}=={aws_orbit.__version__}"]
 
-        hook: plugins.HOOK_TYPE = plugins.PLUGINS_REGISTRIES.get_hook(
-            context=context,
-            team_name=team_context.name,
-            plugin_name=plugin.plugin_id,
-            hook_name="dockerfile_injection_hook",
-        )
+        hook = hooks.get(plugin.plugin_id)
         if hook is not None:
             plugin_cmds = cast(Optional[List[str]], hook(plugin.plugin_id, context, team_context, plugin.parameters))
             if plugin_cmds is not None:
@@ -101,26 +104,21 @@ def _deploy_team_image(context: "Context", team_context: "TeamContext", image: s
 
 
 def _deploy_team_bootstrap(context: "Context", team_context: "TeamContext") -> None:
-    for plugin in team_context.plugins:
-        hook: plugins.HOOK_TYPE = plugins.PLUGINS_REGISTRIES.get_hook(
-            context=context,
-            team_name=team_context.name,
-            plugin_name=plugin.plugin_id,
-            hook_name="bootstrap_injection_hook",
+    for plugin, hook in plugins.PLUGINS_REGISTRIES.get_hooks(
+        context=context, team_context=team_context, hook_name="bootstrap_injection_hook"
+    ):
+        script_content: Optional[str] = cast(
+            Optional[str], hook(plugin.plugin_id, context, team_context, plugin.parameters)
         )
-        if hook is not None:
-            script_content: Optional[str] = cast(
-                Optional[str], hook(plugin.plugin_id, context, team_context, plugin.parameters)
+        if script_content is not None:
+            client = boto3.client("s3")
+            key: str = f"{team_context.bootstrap_s3_prefix}{plugin.plugin_id}.sh"
+            _logger.debug(f"Uploading s3://{context.toolkit.s3_bucket}/{key}")
+            client.put_object(
+                Body=script_content.encode("utf-8"),
+                Bucket=context.toolkit.s3_bucket,
+                Key=key,
             )
-            if script_content is not None:
-                client = boto3.client("s3")
-                key: str = f"{team_context.bootstrap_s3_prefix}{plugin.plugin_id}.sh"
-                _logger.debug(f"Uploading s3://{context.toolkit.s3_bucket}/{key}")
-                client.put_object(
-                    Body=script_content.encode("utf-8"),
-                    Bucket=context.toolkit.s3_bucket,
-                    Key=key,
-                )
 
 
 def deploy_team(context: "Context", manifest: Manifest, team_manifest: TeamManifest) -> None:
@@ -132,16 +130,11 @@ def deploy_team(context: "Context", manifest: Manifest, team_manifest: TeamManif
     if team_context:
         _logger.debug(f"team_context.plugins={team_context.plugins}")
         _logger.debug("Calling team pre_hook")
-        for plugin in team_context.plugins:
-            hook: plugins.HOOK_TYPE = plugins.PLUGINS_REGISTRIES.get_hook(
-                context=context,
-                team_name=team_context.name,
-                plugin_name=plugin.plugin_id,
-                hook_name="pre_hook",
-            )
-            if hook is not None:
-                _logger.debug(f"Found pre_hook for plugin_id {plugin}")
-                hook(plugin.plugin_id, context, team_context, plugin.parameters)
+        for plugin, hook in plugins.PLUGINS_REGISTRIES.get_hooks(
+            context=context, team_context=team_context, hook_name="pre_hook"
+        ):
+            _logger.debug(f"Found pre_hook for plugin_id {plugin}")
+            hook(plugin.plugin_id, context, team_context, plugin.parameters)
         _logger.debug("End of pre_hook plugin execution")
     else:
         _logger.debug(f"Skipping pre_hook for unknown Team: {team_manifest.name}")
@@ -187,28 +180,45 @@ def destroy_team(context: "Context", team_context: "TeamContext") -> None:
 
         _logger.debug("Team specific post_hook execute to destroy the cfn resources")
         _logger.debug(f"team_context.plugins={team_context.plugins}")
-        for plugin in team_context.plugins:
-            _logger.debug(f"Checking post hook for plugin={plugin}")
-            hook: plugins.HOOK_TYPE = plugins.PLUGINS_REGISTRIES.get_hook(
-                context=context,
-                team_name=team_context.name,
-                plugin_name=plugin.plugin_id,
-                hook_name="post_hook",
-            )
-            if hook is not None:
-                _logger.debug(f"Found post hook for team {team_context.name} plugin {plugin.plugin_id}")
-                hook(plugin.plugin_id, context, team_context, plugin.parameters)
+        for plugin, hook in plugins.PLUGINS_REGISTRIES.get_hooks(
+            context=context, team_context=team_context, hook_name="post_hook"
+        ):
+            _logger.debug(f"Found post hook for team {team_context.name} plugin {plugin.plugin_id}")
+            hook(plugin.plugin_id, context, team_context, plugin.parameters)
+
+
+def _destroy_workers() -> int:
+    try:
+        return int(os.environ.get("AWS_ORBIT_TEAMS_DESTROY_WORKERS", "1"))
+    except ValueError:
+        return 1
 
 
 def destroy_all(context: "Context") -> None:
-    for team_context in context.teams:
-        destroy_team(context=context, team_context=team_context)
+    # Parallel team destroys are opt-in, plugin post hooks are not known to be safe to run concurrently
+    workers = min(_destroy_workers(), 8, len(context.teams))
+    if workers <= 1:
+        for team_context in context.teams:
+            destroy_team(context=context, team_context=team_context)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures: List[Future[None]] = [
+                executor.submit(destroy_team, context=context, team_context=team_context)
+                for team_context in context.teams
+            ]
+            # Once a team fails, cancel the destroys that have not started, running ones are left to finish
+            _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+            for f in not_done:
+                f.cancel()
+        for f in futures:
+            if not f.cancelled():
+                f.result()
     context.teams = []
     ContextSerDe.dump_context_to_ssm(context=context)
 
 
 def _delete_efs_endpoints(filesystem_id: str, team_name: str) -> None:
-    efs = boto3.client("efs")
+    efs = boto3_client("efs")
 
     access_points = efs.describe_access_points(FileSystemId=filesystem_id)
 
@@ -47,6 +47,25 @@ def get_parameter_if_exists(name: str) -> Optional[Dict[str, Any]]:
     return cast(Dict[str, Any], json.loads(json_str))
 
 
+def get_parameters(names: List[str], ignore_missing: bool = False) -> List[Dict[str, Any]]:
+    client = boto3_client(service_name="ssm")
+    values: Dict[str, Dict[str, Any]] = {}
+    missing: List[str] = []
+    for i in range(0, len(names), 10):
+        response = client.get_parameters(Names=names[i : i + 10])  # noqa: E203
+        for par in response["Parameters"]:
+            values[par["Name"]] = cast(Dict[str, Any], json.loads(par["Value"]))
+        missing.extend(response.get("InvalidParameters", []))
+    if missing:
+        if not ignore_missing:
+            raise client.exceptions.ParameterNotFound(
+                error_response={"Error": {"Code": "ParameterNotFound", "Message": f"Parameters not found: {missing}"}},
+                operation_name="GetParameters",
+            )
+        _logger.warning("SSM parameters not found, skipping: %s", missing)
+    return [values[n] for n in names if n in values]
+
+
 def does_parameter_exist(name: str) -> bool:
     client = boto3_client(service_name="ssm")
     try:
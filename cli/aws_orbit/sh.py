@@ -8,19 +8,27 @@ from aws_orbit.exceptions import FailedShellCommand
 _logger: logging.Logger = logging.getLogger(__name__)
 
 
-def _clean_up_stdout_line(line: bytes) -> str:
-    line_str = line.decode("utf-8")
-    return line_str[:-1] if line_str.endswith("\n") else line_str
+def _clean_up_stdout_line(line: str) -> str:
+    return line[:-1] if line.endswith("\n") else line
 
 
 def _run_iterating(cmd: str, cwd: Optional[str] = None) -> Iterable[str]:
-    p = subprocess.Popen(shlex.split(cmd), cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    if p.stdout is None:
-        return []
-    while p.poll() is None:
-        yield _clean_up_stdout_line(line=p.stdout.readline())
-    if p.returncode != 0:
-        raise FailedShellCommand(f"Exit code: {p.returncode}")
+    with subprocess.Popen(
+        shlex.split(cmd),
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        universal_newlines=True,
+        encoding="utf-8",
+    ) as p:
+        if p.stdout is None:
+            return []
+        # Block on the pipe until EOF so the tail of the output is never lost to a poll() race
+        for line in p.stdout:
+            yield _clean_up_stdout_line(line=line)
+        if p.wait() != 0:
+            raise FailedShellCommand(f"Exit code: {p.returncode}")
 
 
 def run(cmd: str, cwd: Optional[str] = None, hide_cmd: bool = False) -> None:
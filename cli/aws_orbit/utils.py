@@ -18,6 +18,7 @@ import math
 import os
 import random
 import time
+from functools import lru_cache
 from string import Template
 from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
 
@@ -46,8 +47,16 @@ def get_botocore_config() -> botocore.config.Config:
     )
 
 
+@lru_cache(maxsize=None)
+def _boto3_client(service_name: str, region_name: Optional[str]) -> boto3.client:
+    return boto3.Session(region_name=region_name).client(
+        service_name=service_name, use_ssl=True, config=get_botocore_config()
+    )
+
+
 def boto3_client(service_name: str) -> boto3.client:
-    return boto3.Session().client(service_name=service_name, use_ssl=True, config=get_botocore_config())
+    # Clients are thread safe and expensive to build, so share one per service and region
+    return _boto3_client(service_name=service_name, region_name=boto3.Session().region_name)
 
 
 def boto3_resource(service_name: str) -> boto3.client:
@@ -175,6 +184,9 @@ def get_dns_ip_cidr(context: "Context") -> str:
 
 
 def print_dir(dir: str, exclude: List[str] = []) -> None:
+    # Everything below is debug output, so skip the walk entirely otherwise
+    if not _logger.isEnabledFor(logging.DEBUG):
+        return
     for root, dirnames, filenames in os.walk(dir):
         if exclude:
             for d in list(dirnames):
@@ -15,9 +15,11 @@
 import json
 import logging
 import os
+import queue
 import subprocess
 import time
 from copy import deepcopy
+from multiprocessing.queues import Queue
 from typing import Any, Dict, List, Optional, Union
 
 from kubernetes import config as k8_config
@@ -189,7 +191,7 @@ def load_config(in_cluster: bool = True) -> None:
 
 
 def run_command(cmd: str) -> str:
-    """ Module to run shell commands. """
+    """Module to run shell commands."""
     try:
         output = subprocess.check_output(
             cmd,
@@ -210,3 +212,46 @@ def dynamic_client() -> dynamic.DynamicClient:
 
 
 logger = _get_logger()
+
+
+def _event_key(event: Optional[Dict[str, Any]]) -> Any:
+    # None is the stop sentinel, it never collapses into a real event
+    if event is None:
+        return None
+    metadata = event.get("raw_object", {}).get("metadata", {})
+    return (event.get("type"), metadata.get("namespace"), metadata.get("name"))
+
+
+def _queue_batch_size() -> int:
+    try:
+        return max(1, int(os.environ.get("ORBIT_CONTROLLER_QUEUE_BATCH_SIZE", "1")))
+    except Exception:
+        return 1
+
+
+def get_queue_events(
+    work_queue: "Queue[Optional[Dict[str, Any]]]", max_events: Optional[int] = None
+) -> List[Optional[Dict[str, Any]]]:
+    # Batching is opt-in through ORBIT_CONTROLLER_QUEUE_BATCH_SIZE, a batch is handled serially by one worker
+    # while the others may sit idle, so by default each worker takes a single event as before
+    if max_events is None:
+        max_events = _queue_batch_size()
+
+    # Block for the first event then drain whatever else is already queued, without waiting. A None
+    # sentinel asking the worker to stop ends the batch so each worker consumes exactly one
+    events: List[Optional[Dict[str, Any]]] = [work_queue.get(block=True, timeout=None)]
+    while events[-1] is not None and len(events) < max_events:
+        try:
+            events.append(work_queue.get_nowait())
+        except queue.Empty:
+            break
+
+    # Collapse back to back events for the same object, the latest raw_object wins
+    collapsed: List[Optional[Dict[str, Any]]] = []
+    for event in events:
+        previous = collapsed[-1] if collapsed else None
+        if previous is not None and event is not None and _event_key(previous) == _event_key(event):
+            collapsed[-1] = event
+        else:
+            collapsed.append(event)
+    return collapsed
@@ -18,7 +18,7 @@ import os
 from multiprocessing import Manager, Process
 from multiprocessing.managers import SyncManager
 from multiprocessing.queues import Queue
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, List, Optional, cast
 
 import click
 from click import ClickException
@@ -34,6 +34,30 @@ from orbit_controller import (
 )
 
 
+def _set_affinity(process: Process, index: int) -> None:
+    # Opt in pinning of watcher processes to CPUs round robin, sched_setaffinity is Linux only
+    if os.environ.get("ORBIT_CONTROLLER_CPU_AFFINITY", "False").lower() not in ["true", "yes", "1"]:
+        return
+    if not hasattr(os, "sched_setaffinity") or process.pid is None:
+        return
+    cores = sorted(os.sched_getaffinity(0))
+    try:
+        os.sched_setaffinity(process.pid, {cores[index % len(cores)]})
+    except OSError:
+        logger.warning("Unable to set CPU affinity for process %s", process.pid)
+
+
+def _stop_workers(work_queue: "Queue[Optional[Dict[str, Any]]]", workers: List[Process], timeout: int = 5) -> None:
+    # One None sentinel per worker lets each finish its current event and exit cleanly
+    for _ in workers:
+        work_queue.put(None)
+    for worker in workers:
+        worker.join(timeout=timeout)
+        if worker.is_alive():
+            logger.warning("Worker process %s did not stop within %ss, terminating", worker.pid, timeout)
+            worker.terminate()
+
+
 @click.group()
 def cli() -> None:
     pass
@@ -54,14 +78,17 @@ def watch_namespaces(workers: Optional[int] = None) -> None:
     load_config()
     last_state = get_module_state(module="userspaceChartManager")
 
+    # Events only flow from the monitor to the workers, a pipe backed Queue avoids a round trip to the manager
+    work_queue: "Queue[Optional[Dict[str, Any]]]" = multiprocessing.Queue()
+
     with Manager() as manager:
         sync_manager = cast(SyncManager, manager)
-        work_queue = sync_manager.Queue()
         module_state = sync_manager.dict(**last_state)
 
         logger.info("Starting Namespace Monitoring Process")
         monitor = Process(target=namespace.watch, kwargs={"queue": work_queue, "state": module_state})
         monitor.start()
+        _set_affinity(process=monitor, index=0)
 
         logger.info("Starting Namespace State Updater Process")
         state_updater = Process(
@@ -69,6 +96,7 @@ def watch_namespaces(workers: Optional[int] = None) -> None:
             kwargs={"module": "userspaceChartManager", "state": module_state},
         )
         state_updater.start()
+        _set_affinity(process=state_updater, index=1)
 
         namespace_processors = []
         for i in range(workers):
@@ -79,10 +107,10 @@ def watch_namespaces(workers: Optional[int] = None) -> None:
             )
             namespace_processors.append(namespace_processor)
             namespace_processor.start()
+            _set_affinity(process=namespace_processor, index=i + 2)
 
         monitor.join()
-        for namespace_processor in namespace_processors:
-            namespace_processor.terminate()
+        _stop_workers(work_queue=work_queue, workers=namespace_processors)
         state_updater.terminate()
 
 
@@ -96,14 +124,16 @@ def watch_pod_settings(workers: Optional[int] = None) -> None:
     load_config()
     last_state = get_module_state(module="podsettingsWatcher")
 
+    work_queue: "Queue[Optional[Dict[str, Any]]]" = multiprocessing.Queue()
+
     with Manager() as manager:
         sync_manager = cast(SyncManager, manager)
-        work_queue = sync_manager.Queue()
         module_state = sync_manager.dict(**last_state)
 
         logger.info("Starting PodSettings Monitoring Process")
         monitor = Process(target=pod_setting.watch, kwargs={"queue": work_queue, "state": module_state})
         monitor.start()
+        _set_affinity(process=monitor, index=0)
 
         logger.info("Starting PodSettings State Updater Process")
         state_updater = Process(
@@ -111,6 +141,7 @@ def watch_pod_settings(workers: Optional[int] = None) -> None:
             kwargs={"module": "podsettingsWatcher", "state": module_state},
         )
         state_updater.start()
+        _set_affinity(process=state_updater, index=1)
 
         pod_settings_processors = []
         for i in range(workers):
@@ -121,10 +152,10 @@ def watch_pod_settings(workers: Optional[int] = None) -> None:
             )
             pod_settings_processors.append(pod_settings_processor)
             pod_settings_processor.start()
+            _set_affinity(process=pod_settings_processor, index=i + 2)
 
         monitor.join()
-        for pod_settings_processor in pod_settings_processors:
-            pod_settings_processor.terminate()
+        _stop_workers(work_queue=work_queue, workers=pod_settings_processors)
         state_updater.terminate()
 
 
@@ -138,14 +169,16 @@ def watch_pod_defaults(workers: Optional[int] = None) -> None:
     load_config()
     last_state = get_module_state(module="poddefaultsWatcher")
 
+    work_queue: "Queue[Optional[Dict[str, Any]]]" = multiprocessing.Queue()
+
     with Manager() as manager:
         sync_manager = cast(SyncManager, manager)
-        work_queue = sync_manager.Queue()
         module_state = sync_manager.dict(**last_state)
 
         logger.info("Starting PodDefaults Monitoring Process")
         monitor = Process(target=pod_default.watch, kwargs={"queue": work_queue, "state": module_state})
         monitor.start()
+        _set_affinity(process=monitor, index=0)
 
         logger.info("Starting PodDefaults State Updater Process")
         state_updater = Process(
@@ -153,6 +186,7 @@ def watch_pod_defaults(workers: Optional[int] = None) -> None:
             kwargs={"module": "poddefaultsWatcher", "state": module_state},
         )
         state_updater.start()
+        _set_affinity(process=state_updater, index=1)
 
         pod_defaults_processors = []
         for i in range(workers):
@@ -163,10 +197,10 @@ def watch_pod_defaults(workers: Optional[int] = None) -> None:
             )
             pod_defaults_processors.append(pod_defaults_processor)
             pod_defaults_processor.start()
+            _set_affinity(process=pod_defaults_processor, index=i + 2)
 
         monitor.join()
-        for pod_defaults_processor in pod_defaults_processors:
-            pod_defaults_processor.terminate()
+        _stop_workers(work_queue=work_queue, workers=pod_defaults_processors)
         state_updater.terminate()
 
 
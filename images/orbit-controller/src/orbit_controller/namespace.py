@@ -16,12 +16,20 @@ import json
 import os
 import time
 from multiprocessing import Queue
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict
 
 from kubernetes.client import CoreV1Api, V1ConfigMap
 from kubernetes.client import exceptions as k8s_exceptions
 from kubernetes.watch import Watch
-from orbit_controller import dump_resource, dynamic_client, load_config, logger, pod_default, run_command
+from orbit_controller import (
+    dump_resource,
+    dynamic_client,
+    get_queue_events,
+    load_config,
+    logger,
+    pod_default,
+    run_command,
+)
 from urllib3.exceptions import ReadTimeoutError
 
 
@@ -282,24 +290,30 @@ def watch(queue: Queue, state: Dict[str, Any]) -> int:  # type: ignore
 
 def process_namespaces(queue: Queue, state: Dict[str, Any], replicator_id: int) -> int:  # type: ignore
     logger.info("Started Namespace Processor Id: %s", replicator_id)
-    namespace_event: Optional[Dict[str, Any]] = None
 
     while True:
         try:
-            namespace_event = cast(Dict[str, Any], queue.get(block=True, timeout=None))
-
-            if namespace_event["type"] == "ADDED":
-                process_added_event(namespace=namespace_event["raw_object"])
-            elif namespace_event["type"] == "DELETED":
-                process_removed_event(namespace=namespace_event["raw_object"])
-            else:
-                logger.debug(
-                    "Skipping Namespace event, type: %s raw_objet: %s",
-                    namespace_event["type"],
-                    dump_resource(namespace_event["raw_object"]),
-                )
+            namespace_events = get_queue_events(work_queue=queue)
         except Exception:
-            logger.exception("Failed to process Namespace event: %s", namespace_event)
-        finally:
-            namespace_event = None
+            logger.exception("Failed to read Namespace events from the work queue")
             time.sleep(1)
+            continue
+
+        for namespace_event in namespace_events:
+            if namespace_event is None:
+                logger.info("Stopping Namespace Processor Id: %s", replicator_id)
+                return 0
+            try:
+                if namespace_event["type"] == "ADDED":
+                    process_added_event(namespace=namespace_event["raw_object"])
+                elif namespace_event["type"] == "DELETED":
+                    process_removed_event(namespace=namespace_event["raw_object"])
+                else:
+                    logger.debug(
+                        "Skipping Namespace event, type: %s raw_objet: %s",
+                        namespace_event["type"],
+                        dump_resource(namespace_event["raw_object"]),
+                    )
+            except Exception:
+                logger.exception("Failed to process Namespace event: %s", namespace_event)
+        time.sleep(1)
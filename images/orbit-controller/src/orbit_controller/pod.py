@@ -14,15 +14,19 @@
 
 import base64
 import copy
+import json
 import logging
 import os
 import re
+import threading
+import time
 from copy import deepcopy
-from typing import Any, Dict, List, Optional, cast
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Set, Tuple, cast
 
 import jsonpatch
 import jsonpath_ng
-from flask import jsonify
+from flask import Response
 from kubernetes import dynamic
 from kubernetes.dynamic import exceptions as k8s_exceptions
 from orbit_controller import ORBIT_API_GROUP, ORBIT_API_VERSION, dump_resource, dynamic_client, get_module_state
@@ -32,6 +36,20 @@ from orbit_controller.image_replication import get_desired_image
 
 ORBIT_POD_SETTINGS_CACHE = None
 ORBIT_POD_SETTINGS_STATE = None
+ORBIT_POD_SETTINGS_CHECKED = 0.0
+ORBIT_POD_SETTINGS_LOCK = threading.Lock()
+
+ALLOWED_RESPONSE_PREFIX = b'{"response":{"allowed":true,"uid":'
+ALLOWED_RESPONSE_SUFFIX = b"}}"
+
+NAMESPACE_CACHE: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+NAMESPACE_CACHE_STATE = None
+NAMESPACE_CACHE_CHECKED = 0.0
+NAMESPACE_CACHE_LOCK = threading.Lock()
+NAMESPACE_MISS_TTL = 2.0
+
+DYNAMIC_CLIENT: Optional[dynamic.DynamicClient] = None
+DYNAMIC_CLIENT_LOCK = threading.Lock()
 
 
 def _verbosity() -> int:
@@ -41,78 +59,195 @@ def _verbosity() -> int:
         return 0
 
 
-def get_pod_settings(logger: logging.Logger, client: dynamic.DynamicClient) -> List[Dict[str, Any]]:
+def get_client() -> dynamic.DynamicClient:
+    # Loading the kube config and discovering the API for each admission request is costly, build the client once
+    global DYNAMIC_CLIENT
+
+    if DYNAMIC_CLIENT is None:
+        with DYNAMIC_CLIENT_LOCK:
+            if DYNAMIC_CLIENT is None:
+                DYNAMIC_CLIENT = dynamic_client()
+    return DYNAMIC_CLIENT
+
+
+@lru_cache(maxsize=None)
+def get_resource(
+    client: dynamic.DynamicClient, api_version: str, kind: str, group: Optional[str] = None
+) -> dynamic.Resource:
+    return cast(dynamic.Resource, client.resources.get(api_version=api_version, group=group, kind=kind))
+
+
+SelectorLabels = FrozenSet[Tuple[str, str]]
+SelectorExpression = Tuple[str, str, FrozenSet[str]]
+
+
+class PodSettingIndex:
+    def __init__(self, logger: logging.Logger, pod_settings: List[Dict[str, Any]]) -> None:
+        self.pod_settings = pod_settings
+        self.by_namespace: Dict[str, List[Tuple[Dict[str, Any], SelectorLabels, List[SelectorExpression]]]] = {}
+        for pod_setting in pod_settings:
+            # A malformed podSelector only takes its own PodSetting out of matching, not every admission request
+            try:
+                pod_selector = pod_setting["spec"].get("podSelector", {})
+                selector_labels = frozenset(pod_selector.get("matchLabels", {}).items())
+                selector_expressions = [
+                    (e["key"], e["operator"], frozenset(e.get("values", [])))
+                    for e in pod_selector.get("matchExpressions", [])
+                ]
+                namespace = pod_setting["metadata"]["namespace"]
+            except Exception:
+                logger.warning(
+                    "Skipping PodSetting %s/%s with an invalid podSelector",
+                    pod_setting.get("metadata", {}).get("namespace"),
+                    pod_setting.get("metadata", {}).get("name"),
+                    exc_info=True,
+                )
+                continue
+            # Compile the containerSelector up front so admission requests only run the matcher
+            # an invalid selector is left to fail when the PodSetting is applied, as before
+            container_selector = pod_setting["spec"].get("containerSelector", {})
+            try:
+                if "regex" in container_selector:
+                    _compile_regex(container_selector["regex"])
+                elif "jsonpath" in container_selector:
+                    _parse_jsonpath(container_selector["jsonpath"])
+            except Exception:
+                logger.warning(
+                    "Invalid containerSelector on PodSetting %s/%s: %s",
+                    pod_setting["metadata"].get("namespace"),
+                    pod_setting["metadata"].get("name"),
+                    container_selector,
+                    exc_info=True,
+                )
+            self.by_namespace.setdefault(namespace, []).append((pod_setting, selector_labels, selector_expressions))
+
+
+def _pod_settings_ttl() -> float:
+    try:
+        return float(os.environ.get("ORBIT_POD_SETTINGS_CACHE_TTL", "1"))
+    except Exception:
+        return 1.0
+
+
+def get_pod_settings(logger: logging.Logger, client: dynamic.DynamicClient) -> PodSettingIndex:
     global ORBIT_POD_SETTINGS_CACHE
     global ORBIT_POD_SETTINGS_STATE
+    global ORBIT_POD_SETTINGS_CHECKED
 
-    state_copy = deepcopy(get_module_state(module="podsettingsWatcher"))
-    logger.debug(
-        "pod_settingsWatcher States Previous: %s Current: %s",
-        state_copy,
-        ORBIT_POD_SETTINGS_STATE,
-    )
-    if state_copy != ORBIT_POD_SETTINGS_STATE:
-        logger.debug("Updating pod_settings cache")
-        api = client.resources.get(api_version=ORBIT_API_VERSION, group=ORBIT_API_GROUP, kind="PodSetting")
-        pod_settings = api.get()
-        ORBIT_POD_SETTINGS_CACHE = pod_settings.to_dict().get("items", [])
-    ORBIT_POD_SETTINGS_STATE = state_copy
-    return cast(List[Dict[str, Any]], ORBIT_POD_SETTINGS_CACHE)
+    # The podsettingsWatcher state lives in a ConfigMap, only poll it once per TTL rather than on every request
+    if ORBIT_POD_SETTINGS_CACHE is not None and time.monotonic() - ORBIT_POD_SETTINGS_CHECKED < _pod_settings_ttl():
+        return cast(PodSettingIndex, ORBIT_POD_SETTINGS_CACHE)
+
+    with ORBIT_POD_SETTINGS_LOCK:
+        if ORBIT_POD_SETTINGS_CACHE is not None and time.monotonic() - ORBIT_POD_SETTINGS_CHECKED < _pod_settings_ttl():
+            return cast(PodSettingIndex, ORBIT_POD_SETTINGS_CACHE)
+
+        state_copy = deepcopy(get_module_state(module="podsettingsWatcher"))
+        logger.debug(
+            "pod_settingsWatcher States Previous: %s Current: %s",
+            state_copy,
+            ORBIT_POD_SETTINGS_STATE,
+        )
+        if ORBIT_POD_SETTINGS_CACHE is None or state_copy != ORBIT_POD_SETTINGS_STATE:
+            logger.debug("Updating pod_settings cache")
+            api = get_resource(client=client, api_version=ORBIT_API_VERSION, group=ORBIT_API_GROUP, kind="PodSetting")
+            pod_settings = api.get()
+            ORBIT_POD_SETTINGS_CACHE = PodSettingIndex(
+                logger=logger, pod_settings=pod_settings.to_dict().get("items", [])
+            )
+        ORBIT_POD_SETTINGS_STATE = state_copy
+        ORBIT_POD_SETTINGS_CHECKED = time.monotonic()
+        return ORBIT_POD_SETTINGS_CACHE
+
+
+def _namespace_cache_ttl() -> float:
+    try:
+        return float(os.environ.get("ORBIT_NAMESPACE_CACHE_TTL", "30"))
+    except Exception:
+        return 30.0
+
+
+def _evict_changed_namespaces() -> None:
+    global NAMESPACE_CACHE_STATE
+    global NAMESPACE_CACHE_CHECKED
+
+    # The namespace watcher (userspaceChartManager) records the resourceVersion of every Namespace event it sees
+    # in its module state. Poll it once per TTL, as for PodSettings, and drop the cache whenever it moves so
+    # ADDED/MODIFIED/DELETED Namespaces are fetched again
+    if time.monotonic() - NAMESPACE_CACHE_CHECKED < _pod_settings_ttl():
+        return
+
+    with NAMESPACE_CACHE_LOCK:
+        if time.monotonic() - NAMESPACE_CACHE_CHECKED < _pod_settings_ttl():
+            return
+
+        state_copy = deepcopy(get_module_state(module="userspaceChartManager"))
+        if state_copy != NAMESPACE_CACHE_STATE:
+            NAMESPACE_CACHE.clear()
+        NAMESPACE_CACHE_STATE = state_copy
+        NAMESPACE_CACHE_CHECKED = time.monotonic()
 
 
 def get_namespace(client: dynamic.DynamicClient, name: str) -> Optional[Dict[str, Any]]:
-    api = client.resources.get(api_version="v1", kind="Namespace")
+    # Namespace labels rarely change, keep them for a short while rather than calling back into the API
+    # server on every admission request. Misses are cached too, but only briefly
+    _evict_changed_namespaces()
+    now = time.monotonic()
+    cached = NAMESPACE_CACHE.get(name)
+    if cached is not None and now < cached[0]:
+        return cached[1]
+
+    api = get_resource(client=client, api_version="v1", kind="Namespace")
 
     try:
-        return cast(Dict[str, Any], api.get(name=name).to_dict())
+        namespace = cast(Dict[str, Any], api.get(name=name).to_dict())
     except k8s_exceptions.NotFoundError:
+        NAMESPACE_CACHE[name] = (now + min(NAMESPACE_MISS_TTL, _namespace_cache_ttl()), None)
         return None
 
+    # A Namespace is labelled with its team after creation, never cache it before that or every Pod created
+    # while it is being bootstrapped would miss its PodSettings and PodDefaults
+    if (namespace["metadata"].get("labels") or {}).get("orbit/team"):
+        NAMESPACE_CACHE[name] = (now + _namespace_cache_ttl(), namespace)
+    return namespace
+
 
 def filter_pod_settings(
     logger: logging.Logger,
-    pod_settings: List[Dict[str, Any]],
+    pod_settings: PodSettingIndex,
     namespace: str,
     pod: Dict[str, Any],
 ) -> List[Dict[str, Any]]:
     filtered_pod_settings: List[Dict[str, Any]] = []
 
-    def labels_match(labels: Dict[str, str], selector_labels: Dict[str, str]) -> bool:
-        for key, value in selector_labels.items():
-            label_value = labels.get(key, None)
-            if label_value != value:
-                logger.debug(
-                    "NoHit: Label value check, label %s with value %s does not equal %s",
-                    key,
-                    label_value,
-                    value,
-                )
-                return False
-        return True
+    def labels_match(label_items: SelectorLabels, selector_labels: SelectorLabels) -> bool:
+        if selector_labels <= label_items:
+            return True
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("NoHit: Label value check, labels %s not found on Pod", sorted(selector_labels - label_items))
+        return False
 
-    def expressions_match(labels: Dict[str, str], selector_expressions: List[Dict[str, Any]]) -> bool:
-        for match_expression in selector_expressions:
-            pod_label_value = labels.get(match_expression["key"], None)
-            operator = match_expression["operator"]
-            values = match_expression.get("values", [])
+    def expressions_match(labels: Dict[str, str], selector_expressions: List[SelectorExpression]) -> bool:
+        for key, operator, values in selector_expressions:
+            pod_label_value = labels.get(key, None)
 
             if operator == "Exists" and pod_label_value is None:
                 logger.debug(
                     "NoHit: Exists check, label %s does not exist",
-                    match_expression["key"],
+                    key,
                 )
                 return False
             if operator == "NotExists" and pod_label_value is not None:
                 logger.debug(
                     "NoHit: NotExists check, label %s does exist with value %s",
-                    match_expression["key"],
+                    key,
                     pod_label_value,
                 )
                 return False
             if operator == "In" and pod_label_value not in values:
                 logger.debug(
                     "NoHit: In check, label %s has value %s which is not in %s",
-                    match_expression["key"],
+                    key,
                     pod_label_value,
                     values,
                 )
@@ -120,59 +255,68 @@ def filter_pod_settings(
             if operator == "NotIn" and pod_label_value in values:
                 logger.debug(
                     "NoHit: NotIn check, label %s has value %s which is in %s",
-                    match_expression["key"],
+                    key,
                     pod_label_value,
                     values,
                 )
                 return False
         return True
 
-    for pod_setting in pod_settings:
-        if pod_setting["metadata"]["namespace"] != namespace:
-            logger.debug(
-                "NoHit: PodSetting namespace check. Namespace: %s PodSetting: %s",
-                namespace,
-                dump_resource(pod_setting),
-            )
-            continue
-
-        pod_labels = pod["metadata"].get("labels", {})
-        selector_labels = pod_setting["spec"]["podSelector"].get("matchLabels", {})
-        selector_expressions = pod_setting["spec"]["podSelector"].get("matchExpressions", [])
+    # dump_resource renders whole resources, only pay for it when the debug output is kept
+    debug = logger.isEnabledFor(logging.DEBUG)
+    pod_labels = pod["metadata"].get("labels", {})
+    pod_label_items = frozenset(pod_labels.items())
 
-        if pod_labels == {}:
+    if pod_labels == {}:
+        if debug:
             logger.debug("NoHit: Pod contains no labels to match against: %s", dump_resource(pod))
+        return filtered_pod_settings
+
+    for pod_setting, selector_labels, selector_expressions in pod_settings.by_namespace.get(namespace, []):
+        if not selector_labels and not selector_expressions:
+            if debug:
+                logger.debug(
+                    "NoHit: PodSetting contains no podSelectors to match against: %s",
+                    dump_resource(pod_setting),
+                )
             continue
-        elif selector_labels == {} and selector_expressions == []:
-            logger.debug(
-                "NoHit: PodSetting contains no podSelectors to match against: %s",
-                dump_resource(pod_setting),
-            )
-            continue
-        elif not labels_match(pod_labels, selector_labels):
-            logger.debug(
-                "NoHit: Pod labels and PodSetting matchLabels do not match. Pod: %s PodSetting: %s",
-                dump_resource(pod),
-                dump_resource(pod_setting),
-            )
+        elif not labels_match(pod_label_items, selector_labels):
+            if debug:
+                logger.debug(
+                    "NoHit: Pod labels and PodSetting matchLabels do not match. Pod: %s PodSetting: %s",
+                    dump_resource(pod),
+                    dump_resource(pod_setting),
+                )
             continue
         elif not expressions_match(pod_labels, selector_expressions):
-            logger.debug(
-                "NoHit: Pod labels and PodSetting matchExpressions do not match. Pod: %s PodSetting: %s",
-                dump_resource(pod),
-                dump_resource(pod_setting),
-            )
+            if debug:
+                logger.debug(
+                    "NoHit: Pod labels and PodSetting matchExpressions do not match. Pod: %s PodSetting: %s",
+                    dump_resource(pod),
+                    dump_resource(pod_setting),
+                )
             continue
         else:
-            logger.debug(
-                "Hit: Pod labels and PodSetting podSelectors match. Pod: %s PodSetting: %s",
-                dump_resource(pod),
-                dump_resource(pod_setting),
-            )
+            if debug:
+                logger.debug(
+                    "Hit: Pod labels and PodSetting podSelectors match. Pod: %s PodSetting: %s",
+                    dump_resource(pod),
+                    dump_resource(pod_setting),
+                )
             filtered_pod_settings.append(pod_setting)
     return filtered_pod_settings
 
 
+@lru_cache(maxsize=256)
+def _compile_regex(regex: str) -> Pattern[str]:
+    return re.compile(r".*") if regex == "*" else re.compile(regex)
+
+
+@lru_cache(maxsize=256)
+def _parse_jsonpath(jsonpath: str) -> Any:
+    return jsonpath_ng.parse(jsonpath)
+
+
 def filter_pod_containers(
     containers: List[Dict[str, Any]],
     pod: Dict[str, Any],
@@ -181,12 +325,10 @@ def filter_pod_containers(
     filtered_containers = []
 
     if "regex" in container_selector:
-        container_selector_regex = (
-            re.compile(r".*") if container_selector["regex"] == "*" else re.compile(container_selector["regex"])
-        )
+        container_selector_regex = _compile_regex(container_selector["regex"])
         filtered_containers.extend([c for c in containers if container_selector_regex.match(c.get("name", ""))])
     elif "jsonpath" in container_selector:
-        container_selector_jsonpath = jsonpath_ng.parse(container_selector["jsonpath"])
+        container_selector_jsonpath = _parse_jsonpath(container_selector["jsonpath"])
         filtered_containers.extend(
             [
                 c
@@ -198,11 +340,16 @@ def filter_pod_containers(
     return filtered_containers
 
 
+def _index_of(items: List[Dict[str, Any]], item: Dict[str, Any]) -> int:
+    return next(i for i, x in enumerate(items) if x is item)
+
+
 def apply_settings_to_pod(
     namespace: Dict[str, Any],
     pod_setting: Dict[str, Any],
     pod: Dict[str, Any],
     logger: logging.Logger,
+    patch_paths: Set[str],
 ) -> None:
     ps_spec = pod_setting["spec"]
     pod_spec = pod["spec"]
@@ -215,10 +362,12 @@ def apply_settings_to_pod(
         pod["metadata"]["annotations"]["orbit/applied-podsettings"] = ",".join(applied_pod_settings)
     else:
         pod["metadata"]["annotations"] = {"orbit/applied-podsettings": ",".join(applied_pod_settings)}
+    patch_paths.add("/metadata/annotations")
 
     # Merge
     if "serviceAccountName" in ps_spec:
         pod_spec["serviceAccountName"] = ps_spec.get("serviceAccountName", None)
+        patch_paths.add("/spec/serviceAccountName")
 
     # Merge
     if "labels" in ps_spec:
@@ -226,6 +375,7 @@ def apply_settings_to_pod(
             **pod["metadata"].get("labels", {}),
             **ps_spec.get("labels", {}),
         }
+        patch_paths.add("/metadata/labels")
 
     # Merge
     if "annotations" in ps_spec:
@@ -240,6 +390,7 @@ def apply_settings_to_pod(
             **pod_spec.get("nodeSelector", {}),
             **ps_spec.get("nodeSelector", {}),
         }
+        patch_paths.add("/spec/nodeSelector")
 
     # Merge
     if "securityContext" in ps_spec:
@@ -247,32 +398,37 @@ def apply_settings_to_pod(
             **pod_spec.get("securityContext", {}),
             **ps_spec.get("securityContext", {}),
         }
+        patch_paths.add("/spec/securityContext")
 
     # Merge
     if "volumes" in ps_spec:
+        ps_volumes = ps_spec["volumes"] or []
+        ps_volume_names = {psv["name"] for psv in ps_volumes}
         # Filter out any existing volumes with names that match pod_setting volumes
-        pod_spec["volumes"] = [
-            pv
-            for pv in pod_spec.get("volumes", [])
-            if pv["name"] not in [psv["name"] for psv in ps_spec.get("volumes", [])]
-        ]
+        pod_spec["volumes"] = [pv for pv in pod_spec.get("volumes", []) if pv["name"] not in ps_volume_names]
         # Extend pod volumes with pod_setting volumes
-        pod_spec["volumes"].extend(ps_spec.get("volumes", []))
+        pod_spec["volumes"].extend(ps_volumes)
+        patch_paths.add("/spec/volumes")
 
     # Merge
+    init_containers = pod_spec.get("initContainers", [])
     for container in filter_pod_containers(
-        containers=pod_spec.get("initContainers", []),
+        containers=init_containers,
         pod=pod_spec,
         container_selector=ps_spec.get("containerSelector", {}),
     ):
         apply_settings_to_container(namespace=namespace, pod_setting=pod_setting, pod=pod, container=container)
+        patch_paths.add(f"/spec/initContainers/{_index_of(init_containers, container)}")
+    containers = pod_spec.get("containers", [])
     for container in filter_pod_containers(
-        containers=pod_spec.get("containers", []),
+        containers=containers,
         pod=pod,
         container_selector=ps_spec.get("containerSelector", {}),
     ):
         apply_settings_to_container(namespace=namespace, pod_setting=pod_setting, pod=pod, container=container)
-    logger.debug("modified pod: %s", dump_resource(pod))
+        patch_paths.add(f"/spec/containers/{_index_of(containers, container)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("modified pod: %s", dump_resource(pod))
 
 
 def apply_settings_to_container(
@@ -285,11 +441,12 @@ def apply_settings_to_container(
     ns_annotations = namespace["metadata"].get("annotations", {})
     ps_spec = pod_setting["spec"]
 
+    # Build the env in a local list, the PodSetting is shared by every request served from the cache
     # Drop any previous AWS_ORBIT_USER_SPACE or AWS_ORBIT_IMAGE env variables
-    ps_spec["env"] = [e for e in ps_spec.get("env", []) if e["name"] not in ["AWS_ORBIT_USER_SPACE", "AWS_ORBIT_IMAGE"]]
+    ps_env = [e for e in ps_spec.get("env") or [] if e["name"] not in ["AWS_ORBIT_USER_SPACE", "AWS_ORBIT_IMAGE"]]
 
     # Append new ones
-    ps_spec["env"].extend(
+    ps_env.extend(
         [
             {
                 "name": "AWS_ORBIT_USER_SPACE",
@@ -302,8 +459,8 @@ def apply_settings_to_container(
     # Extend pod_setting ENV
     if "notebookApp" in ps_spec:
         # Drop any previous NB_PREFIX env variable
-        ps_spec["env"] = [e for e in ps_spec.get("env", []) if e["name"] not in ["NB_PREFIX"]]
-        ps_spec["env"].append(
+        ps_env = [e for e in ps_env if e["name"] not in ["NB_PREFIX"]]
+        ps_env.append(
             {
                 "name": "NB_PREFIX",
                 "value": f"/notebook/{pod.get('metadata', {}).get('namespace')}"
@@ -313,9 +470,9 @@ def apply_settings_to_container(
 
     if ps_spec.get("injectUserContext", False):
         # Drop any previous USERNAME or USEREMAIL env variables
-        ps_spec["env"] = [e for e in ps_spec.get("env", []) if e["name"] not in ["USERNAME", "USEREMAIL"]]
+        ps_env = [e for e in ps_env if e["name"] not in ["USERNAME", "USEREMAIL"]]
         # Append new ones
-        ps_spec["env"].extend(
+        ps_env.extend(
             [
                 {
                     "name": "USERNAME",
@@ -349,61 +506,72 @@ def apply_settings_to_container(
         container["args"] = ps_spec["args"]
 
     # Merge
-    if "env" in ps_spec:
-        # Filter out any existing env items with names that match pod_setting env items
-        container["env"] = [
-            pv for pv in container.get("env", []) if pv["name"] not in [psv["name"] for psv in ps_spec.get("env", [])]
-        ]
-        # Extend container env items with container pod_setting env items
-        container["env"].extend(ps_spec.get("env", []))
+    ps_env_names = {psv["name"] for psv in ps_env}
+    # Filter out any existing env items with names that match pod_setting env items
+    container["env"] = [pv for pv in container.get("env", []) if pv["name"] not in ps_env_names]
+    # Extend container env items with container pod_setting env items
+    container["env"].extend(ps_env)
 
     # Extend
     if "envFrom" in ps_spec:
         # Extend container envFrom with pod_setting envFrom
-        container["envFrom"].extend(ps_spec.get("envFrom", []))
+        container.setdefault("envFrom", []).extend(ps_spec["envFrom"] or [])
 
     # Merge
     if "volumeMounts" in ps_spec:
+        ps_volume_mounts = ps_spec["volumeMounts"] or []
+        ps_volume_mount_names = {psv["name"] for psv in ps_volume_mounts}
         # Filter out any existing volumes with names that match pod_setting volumes
         container["volumeMounts"] = [
-            pv
-            for pv in container.get("volumeMounts", [])
-            if pv["name"] not in [psv["name"] for psv in ps_spec.get("volumeMounts", [])]
+            pv for pv in container.get("volumeMounts", []) if pv["name"] not in ps_volume_mount_names
         ]
         # Extend container volumes with container volumes
-        container["volumeMounts"].extend(ps_spec.get("volumeMounts", []))
+        container["volumeMounts"].extend(ps_volume_mounts)
 
     if "resources" in ps_spec:
-        if "resources" not in container:
-            container["resources"] = {}
+        ps_resources = ps_spec["resources"]
+        resources = container.setdefault("resources", {})
 
-        if "limits" in ps_spec["resources"]:
-            container["resources"]["limits"] = {
-                **container["resources"].get("limits", {}),
-                **ps_spec["resources"].get("limits", {}),
+        if "limits" in ps_resources:
+            resources["limits"] = {
+                **resources.get("limits", {}),
+                **ps_resources["limits"],
             }
 
-        if "requests" in ps_spec["resources"]:
-            container["resources"]["requests"] = {
-                **container["resources"].get("requests", {}),
-                **ps_spec["resources"].get("requests", {}),
+        if "requests" in ps_resources:
+            resources["requests"] = {
+                **resources.get("requests", {}),
+                **ps_resources["requests"],
             }
 
 
-def get_response(uid: str, patch: Optional[Dict[str, Any]] = None) -> str:
+def build_patch(pod: Dict[str, Any], patch_paths: Set[str]) -> List[Dict[str, Any]]:
+    # Emit a JSON Patch straight from the paths modified by apply_settings_to_pod rather than diffing
+    # a deep copy of the Pod. "add" on an existing object member replaces it, containers are replaced whole
+    patch = []
+    for path in sorted(patch_paths):
+        value: Any = pod
+        for token in path.split("/")[1:]:
+            value = value[int(token)] if isinstance(value, list) else value[token]
+        op = "replace" if path.startswith(("/spec/containers/", "/spec/initContainers/")) else "add"
+        patch.append({"op": op, "path": path, "value": value})
+    return patch
+
+
+def get_response(uid: str, patch: Optional[List[Dict[str, Any]]] = None) -> Response:
+    if not patch:
+        # Dry runs and unmodified Pods only differ by uid, skip building and serialising the response dict
+        return Response(
+            ALLOWED_RESPONSE_PREFIX + json.dumps(uid).encode() + ALLOWED_RESPONSE_SUFFIX, mimetype="application/json"
+        )
+
     response = {
         "allowed": True,
         "uid": uid,
+        "patch": base64.b64encode(json.dumps(patch, separators=(",", ":")).encode()).decode(),
+        "patchtype": "JSONPatch",
     }
-    if patch:
-        response.update(
-            {
-                "patch": base64.b64encode(str(patch).encode()).decode(),
-                "patchtype": "JSONPatch",
-            }
-        )
-
-    return cast(str, jsonify({"response": response}))
+    return Response(json.dumps({"response": response}, separators=(",", ":")), mimetype="application/json")
 
 
 def process_pod_setting_request(logger: logging.Logger, request: Dict[str, Any]) -> Any:
@@ -412,18 +580,29 @@ def process_pod_setting_request(logger: logging.Logger, request: Dict[str, Any])
         return get_response(uid=request["uid"])
 
     pod = request["object"]
-    modified_pod = copy.deepcopy(pod)
+    patch_paths: Set[str] = set()
 
+    logger.info(
+        "request uid: %s kind: %s namespace: %s",
+        request.get("uid"),
+        request.get("kind", {}).get("kind"),
+        request.get("namespace"),
+    )
     if _verbosity() > 2:
         logger.info("request: %s", request)
 
-    client = dynamic_client()
+    client = get_client()
     pod_settings = get_pod_settings(logger=logger, client=client)
-    logger.debug("pod_settings: %s", dump_resource(pod_settings))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("pod_settings: %s", dump_resource(pod_settings.pod_settings))
+
+    if not pod_settings.by_namespace:
+        logger.debug("No PodSettings found - Skip Pod Mutation")
+        return get_response(uid=request["uid"])
 
     namespace = get_namespace(client=client, name=request["namespace"])
     if namespace is None:
-        logger.error("Fatal error, Namespace %s not found", name=request["namespace"])
+        logger.error("Fatal error, Namespace %s not found", request["namespace"])
         return get_response(uid=request["uid"])
 
     labels = namespace["metadata"].get("labels", {})
@@ -433,29 +612,37 @@ def process_pod_setting_request(logger: logging.Logger, request: Dict[str, Any])
         logger.info("No orbit/team label found on namespace: %s", request["namespace"])
         return get_response(uid=request["uid"])
 
+    if team_namespace not in pod_settings.by_namespace:
+        logger.debug("No PodSettings found for team: %s - Skip Pod Mutation", team_namespace)
+        return get_response(uid=request["uid"])
+
     team_pod_settings = filter_pod_settings(
         logger=logger,
         pod_settings=pod_settings,
         namespace=team_namespace,
         pod=pod,
     )
-    logger.debug("filtered pod_settings: %s", dump_resource(team_pod_settings))
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("filtered pod_settings: %s", dump_resource(team_pod_settings))
 
     try:
         for pod_setting in team_pod_settings:
-            logger.debug("applying pod_setting: %s", dump_resource(pod_setting))
+            if debug:
+                logger.debug("applying pod_setting: %s", dump_resource(pod_setting))
             apply_settings_to_pod(
                 namespace=namespace,
                 pod_setting=pod_setting,
-                pod=modified_pod,
+                pod=pod,
                 logger=logger,
+                patch_paths=patch_paths,
             )
     except Exception as e:
         logger.exception(e)
         pass
 
-    patch = jsonpatch.JsonPatch.from_diff(pod, modified_pod)
-    logger.info("patch: %s", str(patch).encode())
+    patch = build_patch(pod=pod, patch_paths=patch_paths)
+    logger.debug("patch: %s", patch)
     return get_response(uid=request["uid"], patch=patch)
 
 
@@ -467,6 +654,12 @@ def process_image_replication_request(logger: logging.Logger, request: Dict[str,
     pod = request["object"]
     modified_pod = copy.deepcopy(pod)
 
+    logger.info(
+        "request uid: %s kind: %s namespace: %s",
+        request.get("uid"),
+        request.get("kind", {}).get("kind"),
+        request.get("namespace"),
+    )
     if _verbosity() > 2:
         logger.info("request: %s", request)
 
@@ -483,10 +676,10 @@ def process_image_replication_request(logger: logging.Logger, request: Dict[str,
             pod_annotations[f"original-container-image/{container['name']}"] = image
 
     if replications != {}:
-        client = dynamic_client()
+        client = get_client()
         create_image_replication(namespace="orbit-system", images=replications, client=client)
         modified_pod["metadata"]["annotations"] = pod_annotations
 
     patch = jsonpatch.JsonPatch.from_diff(pod, modified_pod)
-    logger.info("patch: %s", str(patch).encode())
-    return get_response(uid=request["uid"], patch=patch)
+    logger.debug("patch: %s", patch)
+    return get_response(uid=request["uid"], patch=patch.patch)
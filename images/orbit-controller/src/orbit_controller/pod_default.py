@@ -20,7 +20,7 @@ from typing import Any, Dict, List, Optional, cast
 from kubernetes import dynamic
 from kubernetes.dynamic import exceptions as k8s_exceptions
 from kubernetes.dynamic.client import DynamicClient
-from orbit_controller import dump_resource, dynamic_client, logger
+from orbit_controller import dump_resource, dynamic_client, get_queue_events, logger
 from urllib3.exceptions import ReadTimeoutError
 
 KUBEFLOW_API_GROUP = "kubeflow.org"
@@ -226,25 +226,31 @@ def watch(queue: Queue, state: Dict[str, Any]) -> int:  # type: ignore
 
 def process_pod_defaults(queue: Queue, state: Dict[str, Any], replicator_id: int) -> int:  # type: ignore
     logger.info("Started PodDefault Processor Id: %s", replicator_id)
-    pod_default_event: Optional[Dict[str, Any]] = None
 
     while True:
         try:
-            pod_default_event = cast(Dict[str, Any], queue.get(block=True, timeout=None))
-
-            if pod_default_event["type"] == "ADDED":
-                process_added_event(pod_default=pod_default_event["raw_object"])
-            elif pod_default_event["type"] == "MODIFIED":
-                process_modified_event(pod_default=pod_default_event["raw_object"])
-            elif pod_default_event["type"] == "DELETED":
-                process_deleted_event(pod_default=pod_default_event["raw_object"])
-            else:
-                logger.debug("Skipping PodDefault event: %s", dump_resource(pod_default_event))
+            pod_default_events = get_queue_events(work_queue=queue)
         except Exception:
-            logger.exception(
-                "Failed to process PodDefault event: %s",
-                dump_resource(pod_default_event),
-            )
-        finally:
-            pod_default_event = None
+            logger.exception("Failed to read PodDefault events from the work queue")
             time.sleep(1)
+            continue
+
+        for pod_default_event in pod_default_events:
+            if pod_default_event is None:
+                logger.info("Stopping PodDefault Processor Id: %s", replicator_id)
+                return 0
+            try:
+                if pod_default_event["type"] == "ADDED":
+                    process_added_event(pod_default=pod_default_event["raw_object"])
+                elif pod_default_event["type"] == "MODIFIED":
+                    process_modified_event(pod_default=pod_default_event["raw_object"])
+                elif pod_default_event["type"] == "DELETED":
+                    process_deleted_event(pod_default=pod_default_event["raw_object"])
+                else:
+                    logger.debug("Skipping PodDefault event: %s", dump_resource(pod_default_event))
+            except Exception:
+                logger.exception(
+                    "Failed to process PodDefault event: %s",
+                    dump_resource(pod_default_event),
+                )
+        time.sleep(1)
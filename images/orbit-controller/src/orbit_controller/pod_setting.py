@@ -15,10 +15,18 @@
 import os
 import time
 from multiprocessing import Queue
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict
 
 from kubernetes.dynamic import exceptions as k8s_exceptions
-from orbit_controller import ORBIT_API_GROUP, ORBIT_API_VERSION, dump_resource, dynamic_client, logger, pod_default
+from orbit_controller import (
+    ORBIT_API_GROUP,
+    ORBIT_API_VERSION,
+    dump_resource,
+    dynamic_client,
+    get_queue_events,
+    logger,
+    pod_default,
+)
 from urllib3.exceptions import ReadTimeoutError
 
 
@@ -164,25 +172,31 @@ def watch(queue: Queue, state: Dict[str, Any]) -> int:  # type: ignore
 
 def process_pod_settings(queue: Queue, state: Dict[str, Any], replicator_id: int) -> int:  # type: ignore
     logger.info("Started PodSetting Processor Id: %s", replicator_id)
-    pod_setting_event: Optional[Dict[str, Any]] = None
 
     while True:
         try:
-            pod_setting_event = cast(Dict[str, Any], queue.get(block=True, timeout=None))
-
-            if pod_setting_event["type"] == "ADDED":
-                process_added_event(pod_setting=pod_setting_event["raw_object"])
-            elif pod_setting_event["type"] == "MODIFIED":
-                process_modified_event(pod_setting=pod_setting_event["raw_object"])
-            # elif pod_setting_event["type"] == "DELETED":
-            #     process_deleted_event(pod_setting=pod_setting_event["raw_object"])
-            else:
-                logger.debug("Skipping PodSetting event: %s", dump_resource(pod_setting_event))
+            pod_setting_events = get_queue_events(work_queue=queue)
         except Exception:
-            logger.exception(
-                "Failed to process PodSetting event: %s",
-                dump_resource(pod_setting_event),
-            )
-        finally:
-            pod_setting_event = None
+            logger.exception("Failed to read PodSetting events from the work queue")
             time.sleep(1)
+            continue
+
+        for pod_setting_event in pod_setting_events:
+            if pod_setting_event is None:
+                logger.info("Stopping PodSetting Processor Id: %s", replicator_id)
+                return 0
+            try:
+                if pod_setting_event["type"] == "ADDED":
+                    process_added_event(pod_setting=pod_setting_event["raw_object"])
+                elif pod_setting_event["type"] == "MODIFIED":
+                    process_modified_event(pod_setting=pod_setting_event["raw_object"])
+                # elif pod_setting_event["type"] == "DELETED":
+                #     process_deleted_event(pod_setting=pod_setting_event["raw_object"])
+                else:
+                    logger.debug("Skipping PodSetting event: %s", dump_resource(pod_setting_event))
+            except Exception:
+                logger.exception(
+                    "Failed to process PodSetting event: %s",
+                    dump_resource(pod_setting_event),
+                )
+        time.sleep(1)